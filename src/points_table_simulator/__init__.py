@@ -1,3 +1,5 @@
+from typing import TYPE_CHECKING
+
 from points_table_simulator.exceptions import (
     AllMatchesCompletedError,
     InvalidColumnNamesError,
@@ -6,6 +8,18 @@ from points_table_simulator.exceptions import (
     TeamNotFoundError,
     TournamentCompletionBelowCutoffError
 )
-from points_table_simulator.points_table_simulator import (  # pylint: disable = cyclic-import
-    PointsTableSimulator
-)
+
+# Static alias for type checkers and linters; at runtime the class (and its pandas
+# dependency) is still only imported on first access via __getattr__ below
+if TYPE_CHECKING:
+    from points_table_simulator.points_table_simulator import PointsTableSimulator
+
+
+def __getattr__(name: str):
+    """Imports PointsTableSimulator (and its pandas dependency) lazily on first access (PEP 562)."""
+    if name == "PointsTableSimulator":
+        from points_table_simulator.points_table_simulator import (  # pylint: disable = import-outside-toplevel, cyclic-import
+            PointsTableSimulator
+        )
+        return PointsTableSimulator
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
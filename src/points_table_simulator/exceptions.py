@@ -4,6 +4,7 @@ Custom Exceptions Module
 This module defines custom exception classes used in the project.
 
 Classes:
+    AllMatchesCompletedError: Exception raised when all matches in the given schedule are completed.
     InvalidColumnNamesError: Exception raised when the invalid column names are found in the tournament schedule DataFrame.
     InvalidScheduleDataError: Exception raised when the input schedule dataframe is invalid.
     NoQualifyingScenariosError: Exception raised when no qualifying scenarios are found for the given team.
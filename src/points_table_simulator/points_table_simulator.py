@@ -53,8 +53,11 @@ Author:
 """
 
 import itertools
-from typing import Dict, List, Tuple, Union
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Tuple, Union
+import numpy as np
 import pandas as pd
+from pandas.core.util.hashing import hash_pandas_object
 from points_table_simulator import (
     AllMatchesCompletedError,
     InvalidColumnNamesError,
@@ -67,6 +70,34 @@ from points_table_simulator.constants import (
     TOURNAMENT_COMPLETION_CUTOFF_PERCENTAGE
 )
 
+_INIT_ARGUMENT_TYPE_SPEC: Tuple[Tuple[str, type], ...] = (
+    ("tournament_schedule", pd.DataFrame),
+    ("points_for_a_win", int),
+    ("points_for_a_no_result", int),
+    ("points_for_a_draw", int),
+)
+
+_SIMULATION_ARGUMENT_TYPE_SPEC: Tuple[Tuple[str, type], ...] = (
+    ("team_name", str),
+    ("top_x_position_in_the_table", int),
+    ("desired_number_of_scenarios", int),
+)
+
+
+@dataclass
+class _PointsState:
+    """
+    Structure-of-arrays snapshot of the points table used by the simulation hot loop.
+
+    The row order matches the current points table, fixing the tie-break order; the simulation updates
+    these plain arrays and only converts back to a DataFrame for qualifying scenarios.
+    """
+    team_row_index: Dict[str, int]
+    matches_played: np.ndarray
+    matches_won: np.ndarray
+    matches_lost: np.ndarray
+    points: np.ndarray
+
 
 class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
 
@@ -156,18 +187,20 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
         self.tournament_schedule_winning_team_column_name: str = tournament_schedule_winning_team_column_name
         self._validate_schedule_dataframe_columns()
         self._validate_schedule_dataframe_data()
+        self._encode_team_columns()
+        self._encoded_schedule_fingerprint: Tuple[int, int] = self._schedule_fingerprint()
+        self._points_table_cache: Union[Tuple[Tuple[int, int], pd.DataFrame], None] = None
 
     @property
-    def available_teams_in_fixture(self) -> set[str]:
+    def available_teams_in_fixture(self) -> np.ndarray:
         """
-        Returns a set of available teams in the tournament schedule.
+        Returns the available teams in the tournament schedule, in order of first appearance.
 
         Returns:
-            set: Set of available teams in the tournament schedule.
+            np.ndarray: Array of available teams in the tournament schedule.
         """
-        return set(self.tournament_schedule[self.tournament_schedule_away_team_column_name].unique()).union(
-            set(self.tournament_schedule[self.tournament_schedule_home_team_column_name].unique())
-        )
+        self._refresh_team_encoding(self._schedule_fingerprint())
+        return self._team_names
 
     @property
     def current_points_table(self) -> pd.DataFrame:
@@ -186,75 +219,37 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
                 - 'points': The total points earned by the team based on wins, draws, and no results.
         """
 
-        team_points_data: List = []
-
-        for team in self.available_teams_in_fixture:
-            matches_played: int = len(self.tournament_schedule[
-                (
-                    (self.tournament_schedule[self.tournament_schedule_away_team_column_name] == team) |
-                    (self.tournament_schedule[self.tournament_schedule_home_team_column_name] == team)
-                ) &
-                (
-                    (self.tournament_schedule[self.tournament_schedule_winning_team_column_name].fillna("") != "")
-                )
-            ])
-
-            matches_won: int = len(self.tournament_schedule[
-                (self.tournament_schedule[self.tournament_schedule_winning_team_column_name] == team)
-            ])
-
-            matches_lost: int = len(self.tournament_schedule[
-                (
-                    (self.tournament_schedule[self.tournament_schedule_away_team_column_name] == team) |
-                    (self.tournament_schedule[self.tournament_schedule_home_team_column_name] == team)
-                ) &
-                (
-                    (self.tournament_schedule[self.tournament_schedule_winning_team_column_name] != team) &
-                    (self.tournament_schedule[self.tournament_schedule_winning_team_column_name].fillna("") != "")
-                )
-            ])
-
-            matches_drawn: int = len(self.tournament_schedule[
-                ((self.tournament_schedule[self.tournament_schedule_away_team_column_name] == team) |
-                (self.tournament_schedule[self.tournament_schedule_home_team_column_name] == team)) &
-                (self.tournament_schedule[self.tournament_schedule_winning_team_column_name] == "Draw")
-            ])
-
-            matches_with_no_result: int = len(self.tournament_schedule[
-                ((self.tournament_schedule[self.tournament_schedule_away_team_column_name] == team) |
-                (self.tournament_schedule[self.tournament_schedule_home_team_column_name] == team)) &
-                (self.tournament_schedule[self.tournament_schedule_winning_team_column_name] == "No Result")
-            ])
-
-            remaining_matches: int = len(self.tournament_schedule[
-                (
-                    (self.tournament_schedule[self.tournament_schedule_away_team_column_name] == team) |
-                    (self.tournament_schedule[self.tournament_schedule_home_team_column_name] == team)
-                ) &
-                (
-                    (self.tournament_schedule[self.tournament_schedule_winning_team_column_name].fillna("") == "")
-                )
-            ])
-
-            points: int = (matches_won * self.points_for_a_win) + (matches_drawn * self.points_for_a_draw) + \
-                (matches_with_no_result * self.points_for_a_no_result)
-
-            team_points_data.append({
-                "team": team,
-                "matches_played": matches_played,
-                "matches_won": matches_won,
-                "matches_lost": matches_lost,
-                "matches_drawn": matches_drawn,
-                "matches_with_no_result": matches_with_no_result,
-                "remaining_matches": remaining_matches,
-                "points": points
-            })
+        fingerprint = self._schedule_fingerprint()
+        # Callers get a copy of the cached frame: handing out the cached object by reference would let
+        # a caller's in-place edits corrupt every later read, since the fingerprint only tracks the schedule
+        if self._points_table_cache is not None and self._points_table_cache[0] == fingerprint:
+            return self._points_table_cache[1].copy()
+        self._refresh_team_encoding(fingerprint)
 
-        current_points_table = pd.DataFrame(team_points_data)
-        current_points_table.sort_values(by="points", ascending=False, inplace=True)
-        current_points_table.reset_index(drop=True, inplace=True)
+        (matches_played, matches_won, matches_lost, matches_drawn, matches_with_no_result, remaining_matches) = self._tally_team_counts(
+            self._home_team_codes, self._away_team_codes, self._winning_team_codes, len(self._team_names)
+        )
+        points = (
+            matches_won * self.points_for_a_win +
+            matches_drawn * self.points_for_a_draw +
+            matches_with_no_result * self.points_for_a_no_result
+        )
 
-        return current_points_table
+        # Stable descending order by points, applied while the columns are still plain arrays
+        order = np.argsort(-points, kind="stable")
+        current_points_table = pd.DataFrame({
+            "team": self._team_names[order],
+            "matches_played": matches_played[order],
+            "matches_won": matches_won[order],
+            "matches_lost": matches_lost[order],
+            "matches_drawn": matches_drawn[order],
+            "matches_with_no_result": matches_with_no_result[order],
+            "remaining_matches": remaining_matches[order],
+            "points": points[order],
+        })
+        self._points_table_cache = (fingerprint, current_points_table)
+
+        return current_points_table.copy()
 
     @property
     def number_of_completed_matches(self) -> int:
@@ -278,20 +273,28 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
         Returns:
             List[Tuple[str, str]]: List of tuples containing the remaining matches in the tournament schedule.
         """
-        remaining_matches_df = self.tournament_schedule[
-            self.tournament_schedule[self.tournament_schedule_winning_team_column_name].fillna("") == ""
-        ]
-        remaining_matches = list(remaining_matches_df.apply(
-            lambda row: (row[self.tournament_schedule_home_team_column_name], row[self.tournament_schedule_away_team_column_name]),
-            axis=1
-        ))
-        return remaining_matches
+        winning_team_array = self.tournament_schedule[self.tournament_schedule_winning_team_column_name].to_numpy()
+        # Comparing missing values (e.g. pd.NA from nullable string columns) against "" is ambiguous,
+        # so the equality check only runs on the non-missing entries
+        remaining_mask = pd.isna(winning_team_array)
+        decided_mask = ~remaining_mask
+        remaining_mask[decided_mask] = winning_team_array[decided_mask] == ""
+        home_team_array = self.tournament_schedule[self.tournament_schedule_home_team_column_name].to_numpy()[remaining_mask]
+        away_team_array = self.tournament_schedule[self.tournament_schedule_away_team_column_name].to_numpy()[remaining_mask]
+        return list(zip(home_team_array, away_team_array))
 
     @property
-    def various_probable_outcomes_for_remaining_matches(self) -> itertools.product:
+    def various_probable_outcomes_for_remaining_matches(self) -> Iterator[Tuple[str, ...]]:
+        """
+        Returns a lazy iterator over every possible winner combination for the remaining matches.
+
+        The combinations are never materialized as a list: with R remaining matches there are 2^R of
+        them, and callers that stop early (such as the qualification search) should only pay for the
+        outcomes they actually consume.
+        """
         return itertools.product(*self.remaining_matches)
 
-    def simulate_the_qualification_scenarios(
+    def simulate_the_qualification_scenarios(       # pylint: disable = too-many-locals
         self, team_name: str, top_x_position_in_the_table: int, desired_number_of_scenarios: int = 3
     ) -> Tuple[List[pd.DataFrame], List[pd.DataFrame]]:
         """
@@ -336,20 +339,77 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
         self._check_for_minimal_tournament_completion()
         list_of_points_tables_for_qualification_scenarios = []
         list_of_remaining_match_result_for_qualification_scenarios = []
-        current_points_dict: Dict[str, int] = self.current_points_table.set_index("team")["points"].to_dict()   # pylint: disable=unsubscriptable-object
 
-        for remaining_matches_winning_teams in self.various_probable_outcomes_for_remaining_matches:
-            _is_favourable_scenario = self._check_the_given_scenario_for_favourable_outcome(
-                current_points_dict.copy(), remaining_matches_winning_teams, team_name, top_x_position_in_the_table
-            )
-            if _is_favourable_scenario:
-                updated_points_table, temporary_schedule_df = _is_favourable_scenario
-                list_of_points_tables_for_qualification_scenarios.append(updated_points_table)
-                list_of_remaining_match_result_for_qualification_scenarios.append(temporary_schedule_df)
+        # Hoisted out of the loop: each of these properties re-filters the schedule on every access,
+        # and the scenario check needs them for every simulated outcome
+        remaining_matches = self.remaining_matches
+        remaining_schedule_df = self.remaining_schedule_df
+
+        # Numeric view of the standings: the row order of the current table fixes the tie-break
+        # order, and each remaining match becomes a pair of row indices into the points array
+        initial_points_table = self.current_points_table
+        points_state = _PointsState(
+            team_row_index={team: row for row, team in enumerate(initial_points_table["team"].to_numpy())},     # pylint: disable=unsubscriptable-object
+            matches_played=initial_points_table["matches_played"].to_numpy(),   # pylint: disable=unsubscriptable-object
+            matches_won=initial_points_table["matches_won"].to_numpy(),     # pylint: disable=unsubscriptable-object
+            matches_lost=initial_points_table["matches_lost"].to_numpy(),   # pylint: disable=unsubscriptable-object
+            points=initial_points_table["points"].to_numpy(),   # pylint: disable=unsubscriptable-object
+        )
+        base_points = points_state.points
+        remaining_match_rows = [
+            (points_state.team_row_index[home_team], points_state.team_row_index[away_team])
+            for home_team, away_team in remaining_matches
+        ]
+        team_row = points_state.team_row_index[team_name]
+
+        # Bound-based pruning: a team whose best case stays strictly below the target team, or whose
+        # worst case stays strictly above it, contributes the same amount to the target's rank in
+        # every scenario. Matches played only between such teams cannot change the verdict, so the
+        # qualification check is memoized on the outcomes of the remaining (relevant) matches.
+        remaining_match_counts = np.zeros(len(base_points), dtype=np.int64)
+        for home_team_row, away_team_row in remaining_match_rows:
+            remaining_match_counts[home_team_row] += 1
+            remaining_match_counts[away_team_row] += 1
+        maximum_points = base_points + self.points_for_a_win * remaining_match_counts
+        rank_contribution_is_invariant = (maximum_points < base_points[team_row]) | (base_points > maximum_points[team_row])
+        relevant_match_numbers = [
+            match_number for match_number, (home_team_row, away_team_row) in enumerate(remaining_match_rows)
+            if team_row in (home_team_row, away_team_row)
+            or not (rank_contribution_is_invariant[home_team_row] and rank_contribution_is_invariant[away_team_row])
+        ]
+        scenario_verdicts: Dict[Tuple[int, ...], bool] = {}
+        verdicts_by_points_signature: Dict[bytes, bool] = {}
 
+        for winning_sides in itertools.product((0, 1), repeat=len(remaining_matches)):
             if len(list_of_points_tables_for_qualification_scenarios) >= desired_number_of_scenarios:
                 break
 
+            relevant_outcome = tuple(winning_sides[match_number] for match_number in relevant_match_numbers)
+            verdict = scenario_verdicts.get(relevant_outcome)
+            if verdict is None:
+                scenario_points = base_points.copy()
+                for match_number, winning_side in enumerate(winning_sides):
+                    scenario_points[remaining_match_rows[match_number][winning_side]] += self.points_for_a_win
+                # Different outcome combinations often land on the same standings (the order in which
+                # teams trade wins does not matter), so the rank check is also memoized on the raw
+                # points vector
+                points_signature = scenario_points.tobytes()
+                verdict = verdicts_by_points_signature.get(points_signature)
+                if verdict is None:
+                    verdict = self._scenario_puts_team_in_top_x(scenario_points, team_row, top_x_position_in_the_table)
+                    verdicts_by_points_signature[points_signature] = verdict
+                scenario_verdicts[relevant_outcome] = verdict
+
+            if verdict:
+                remaining_matches_winning_teams = tuple(
+                    remaining_matches[match_number][winning_side] for match_number, winning_side in enumerate(winning_sides)
+                )
+                updated_points_table, temporary_schedule_df = self._build_qualification_scenario_outputs(
+                    remaining_matches_winning_teams, remaining_matches, remaining_schedule_df, points_state
+                )
+                list_of_points_tables_for_qualification_scenarios.append(updated_points_table)
+                list_of_remaining_match_result_for_qualification_scenarios.append(temporary_schedule_df)
+
         if not list_of_points_tables_for_qualification_scenarios:
             raise NoQualifyingScenariosError(top_x_position_in_the_table, team_name)
 
@@ -368,68 +428,166 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
         if tournament_completion_percentage < TOURNAMENT_COMPLETION_CUTOFF_PERCENTAGE:
             raise TournamentCompletionBelowCutoffError(TOURNAMENT_COMPLETION_CUTOFF_PERCENTAGE, round(tournament_completion_percentage, 2))
 
-    def _check_the_given_scenario_for_favourable_outcome(
-        self, current_points_dict: Dict[str, int], remaining_matches_winning_teams: Tuple[str], team_name: str, top_x_position_in_the_table:int
-    ) -> Union[Tuple[pd.DataFrame, pd.DataFrame], None]:
+    def _build_qualification_scenario_outputs(
+        self, remaining_matches_winning_teams: Tuple[str, ...], remaining_matches: List[Tuple[str, str]],
+        remaining_schedule_df: pd.DataFrame, points_state: _PointsState
+    ) -> Tuple[pd.DataFrame, pd.DataFrame]:
         """
-        Checks if the given scenario is favourable for the specified team.
+        Builds the points table and remaining-match outcome DataFrames for a qualifying scenario.
 
-        This function iterates through all possible combinations of match results for the remaining matches
-        in the tournament schedule. For each combination, it calculates the updated points table and checks
-        if the specified team qualifies within the top X positions. Once enough qualifying scenarios are found
-        based on the desired number of scenarios, the function stops iterating and returns the results.
+        Only called for scenarios that have already passed the numeric qualification check, which keeps
+        the pandas copies and per-match updates off the enumeration hot path.
 
         Returns:
-            Union[Tuple[pd.DataFrame, pd.DataFrame], None]: A tuple containing two dataframes:
+            Tuple[pd.DataFrame, pd.DataFrame]: A tuple containing two dataframes:
                 - The updated points table for the given scenario.
                 - The remaining match outcome for the given scenario.
         """
-        updated_points_dict = self._update_winning_team_points_dict(current_points_dict, remaining_matches_winning_teams)
-        top_x_positions_teams = list(updated_points_dict.keys())[:top_x_position_in_the_table]
-
-        if team_name in top_x_positions_teams:
-            remaining_outcome_df = self.remaining_schedule_df.copy()
-            udpated_points_table = self.current_points_table.copy()
-
-            for match_number, possible_winning_team in enumerate(remaining_matches_winning_teams):
-                home_team, away_team = self.remaining_matches[match_number]
-                remaining_outcome_df.loc[
-                    self.number_of_completed_matches + match_number,
-                    self.tournament_schedule_winning_team_column_name
-                ] = possible_winning_team
-                losing_team = home_team if away_team == possible_winning_team else away_team
-                udpated_points_table = self._update_points_table(
-                    losing_team, udpated_points_table, possible_winning_team
-                )
-            udpated_points_table.sort_values(by="points", ascending=False, inplace=True)
-            udpated_points_table.reset_index(drop=True, inplace=True)
+        # The remaining schedule rows line up one-to-one with the simulated winners, so the outcome
+        # column is written in a single assignment rather than one .loc label write per match
+        remaining_outcome_df = remaining_schedule_df.copy()
+        remaining_outcome_df[self.tournament_schedule_winning_team_column_name] = list(remaining_matches_winning_teams)
+        udpated_points_table = self.current_points_table
+
+        # O(1) row lookups and plain array increments instead of a boolean mask scan per team per match
+        team_row_index = points_state.team_row_index
+        matches_played = points_state.matches_played.copy()
+        matches_won = points_state.matches_won.copy()
+        matches_lost = points_state.matches_lost.copy()
+        points = points_state.points.copy()
+
+        for match_number, possible_winning_team in enumerate(remaining_matches_winning_teams):
+            home_team, away_team = remaining_matches[match_number]
+            losing_team = home_team if away_team == possible_winning_team else away_team
+            winning_team_row = team_row_index[possible_winning_team]
+            losing_team_row = team_row_index[losing_team]
+            matches_played[winning_team_row] += 1
+            matches_played[losing_team_row] += 1
+            matches_won[winning_team_row] += 1
+            matches_lost[losing_team_row] += 1
+            points[winning_team_row] += self.points_for_a_win
+
+        udpated_points_table["matches_played"] = matches_played
+        udpated_points_table["matches_won"] = matches_won
+        udpated_points_table["matches_lost"] = matches_lost
+        udpated_points_table["points"] = points
+        udpated_points_table.sort_values(by="points", ascending=False, inplace=True)
+        udpated_points_table.reset_index(drop=True, inplace=True)
+
+        return udpated_points_table, remaining_outcome_df
+
+    def _encode_team_columns(self) -> None:
+        """
+        Encodes the home, away and winning team columns as categorical codes sharing a single category set.
 
-            return udpated_points_table, remaining_outcome_df
+        String equality on object arrays dominates the points table computation; comparing small integer
+        codes instead lets numpy run tight C loops over the hot columns. The winning team column shares
+        the team categories, extended with the "Draw" and "No Result" sentinels; unfinished matches
+        (NaN or empty winner) encode to -1.
+        """
+        home_teams = self.tournament_schedule[self.tournament_schedule_home_team_column_name].to_numpy()
+        away_teams = self.tournament_schedule[self.tournament_schedule_away_team_column_name].to_numpy()
+        self._team_names = pd.unique(np.concatenate([home_teams, away_teams]))
+        categories = np.concatenate([self._team_names, np.array(["Draw", "No Result"], dtype=object)])
+        self._home_team_codes = pd.Categorical(home_teams, categories=categories).codes
+        self._away_team_codes = pd.Categorical(away_teams, categories=categories).codes
+        self._winning_team_codes = pd.Categorical(
+            self.tournament_schedule[self.tournament_schedule_winning_team_column_name].to_numpy(), categories=categories
+        ).codes
+
+    def _refresh_team_encoding(self, fingerprint: Tuple[int, int]) -> None:
+        """
+        Rebuilds the encoded team code arrays if the tournament schedule has changed since they were built.
 
-        return None
+        The public `tournament_schedule` attribute stays a plain DataFrame for compatibility; the internal
+        structure-of-arrays views are only re-derived when the schedule fingerprint no longer matches.
+        """
+        if fingerprint != self._encoded_schedule_fingerprint:
+            self._encode_team_columns()
+            self._encoded_schedule_fingerprint = fingerprint
 
-    def _update_points_table(
-        self, losing_team: str, points_table: pd.DataFrame, winning_team: str
-    ) -> pd.DataFrame:
-        points_table.loc[points_table["team"] == losing_team, ["matches_lost", "matches_played"]] += [1, 1]
-        points_table.loc[points_table["team"] == winning_team, ["matches_played", "matches_won", "points"]] += [1, 1, self.points_for_a_win]
-        return points_table
+    def _schedule_fingerprint(self) -> Tuple[int, int]:
+        """
+        Returns a cheap fingerprint of the tournament schedule, used to invalidate the cached points table
+        and the encoded team code arrays.
 
-    def _update_winning_team_points_dict(self, current_points_dict: Dict[str, int], remaining_matches_winning_teams: Tuple[str]) -> Dict[str, int]:
+        Only the home, away and winner columns can change the points table, so the fingerprint is their
+        vectorized hash sum together with the schedule length.
         """
-        Updates the points dictionary for the winning teams in the remaining matches.
+        schedule_team_columns = self.tournament_schedule[[
+            self.tournament_schedule_home_team_column_name,
+            self.tournament_schedule_away_team_column_name,
+            self.tournament_schedule_winning_team_column_name,
+        ]]
+        return (
+            len(self.tournament_schedule),
+            int(hash_pandas_object(schedule_team_columns, index=False).sum())
+        )
 
-        Args:
-            current_points_dict (Dict[str, int]): The current points dictionary.
-            remaining_matches_winning_teams (Tuple[str]): The winning teams in the remaining matches.
+    @staticmethod
+    def _tally_team_counts(
+        home_team_codes: np.ndarray, away_team_codes: np.ndarray, winning_team_codes: np.ndarray, number_of_teams: int
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Tallies the per-team match counters from the encoded schedule columns in a single pass.
+
+        The kernel operates purely on integer code arrays (no pandas objects), so each counter is a
+        pair of bincount calls over the hot columns and the rest is vector arithmetic.
 
         Returns:
-            Dict[str, int]: The updated points dictionary.
+            Tuple[np.ndarray, ...]: Arrays of (matches_played, matches_won, matches_lost, matches_drawn,
+                matches_with_no_result, remaining_matches), indexed by team code.
+        """
+        draw_code = number_of_teams
+        no_result_code = number_of_teams + 1
+
+        # Boolean masks over the winner codes, computed once and shared by all counters below
+        remaining_mask = winning_team_codes == -1
+        drawn_mask = winning_team_codes == draw_code
+        no_result_mask = winning_team_codes == no_result_code
+        decided_mask = ~(remaining_mask | drawn_mask | no_result_mask)
+
+        matches_won = np.bincount(winning_team_codes[decided_mask], minlength=number_of_teams)
+
+        # Draws and no-results are structurally absent from many tournament formats; skip their
+        # bincount passes entirely in that common case
+        if drawn_mask.any():
+            matches_drawn = (
+                np.bincount(home_team_codes[drawn_mask], minlength=number_of_teams) +
+                np.bincount(away_team_codes[drawn_mask], minlength=number_of_teams)
+            )
+        else:
+            matches_drawn = np.zeros(number_of_teams, dtype=np.int64)
+        if no_result_mask.any():
+            matches_with_no_result = (
+                np.bincount(home_team_codes[no_result_mask], minlength=number_of_teams) +
+                np.bincount(away_team_codes[no_result_mask], minlength=number_of_teams)
+            )
+        else:
+            matches_with_no_result = np.zeros(number_of_teams, dtype=np.int64)
+        remaining_matches = (
+            np.bincount(home_team_codes[remaining_mask], minlength=number_of_teams) +
+            np.bincount(away_team_codes[remaining_mask], minlength=number_of_teams)
+        )
+        matches_played = (
+            np.bincount(home_team_codes[~remaining_mask], minlength=number_of_teams) +
+            np.bincount(away_team_codes[~remaining_mask], minlength=number_of_teams)
+        )
+        matches_lost = matches_played - matches_won - matches_drawn - matches_with_no_result
+
+        return matches_played, matches_won, matches_lost, matches_drawn, matches_with_no_result, remaining_matches
+
+    @staticmethod
+    def _scenario_puts_team_in_top_x(scenario_points: np.ndarray, team_row: int, top_x_position_in_the_table: int) -> bool:
+        """
+        Checks whether the team at the given table row finishes within the top X positions for the given points.
+
+        The rank is the number of teams with strictly more points plus the earlier-row teams on equal points,
+        which reproduces a stable descending sort of the table without actually sorting it.
         """
-        for team in remaining_matches_winning_teams:
-            current_points_dict[team] += self.points_for_a_win
-        updated_points_dict = dict(sorted(current_points_dict.items(), key=lambda item: item[1], reverse=True))
-        return updated_points_dict
+        team_points = scenario_points[team_row]
+        rank = int((scenario_points > team_points).sum()) + int((scenario_points[:team_row] == team_points).sum())
+        return rank < top_x_position_in_the_table
 
     @staticmethod
     def _validate_input_types(
@@ -459,14 +617,8 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
         Raises:
             TypeError: If any of the input arguments have incorrect types.
         """
-        type_map = {
-            "tournament_schedule": (tournament_schedule, pd.DataFrame),
-            "points_for_a_win": (points_for_a_win, int),
-            "points_for_a_no_result": (points_for_a_no_result, int),
-            "points_for_a_draw": (points_for_a_draw, int),
-        }
-
-        for arg_name, (arg_value, expected_type) in type_map.items():
+        argument_values = (tournament_schedule, points_for_a_win, points_for_a_no_result, points_for_a_draw)
+        for (arg_name, expected_type), arg_value in zip(_INIT_ARGUMENT_TYPE_SPEC, argument_values):
             if not isinstance(arg_value, expected_type):
                 raise TypeError(f"'{arg_name}' must be a '{expected_type}'")
         for key, value in kwargs.items():
@@ -486,7 +638,7 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
             "tournament_schedule_match_number_column_name": self.tournament_schedule_match_number_column_name,
             "tournament_schedule_winning_team_column_name": self.tournament_schedule_winning_team_column_name,
         }
-        schedule_dataframe_columns = self.tournament_schedule.columns
+        schedule_dataframe_columns = set(self.tournament_schedule.columns)
         for column_name, column_value in _column_map.items():
             if column_value not in schedule_dataframe_columns:
                 raise InvalidColumnNamesError(column_name, column_value)
@@ -505,14 +657,10 @@ class PointsTableSimulator:     # pylint: disable = too-many-instance-attributes
     def _validate_the_inputs_for_simulate_qualification_scenarios(
         self, team_name: str, top_x_position_in_the_table: int, desired_number_of_scenarios: int
     ):
-        _type_map: Dict[str, type] = {
-            "team_name": str,
-            "top_x_position_in_the_table": int,
-            "desired_number_of_scenarios": int,
-        }
-        for key, value in _type_map.items():
-            if not isinstance(locals()[key], value):
-                raise TypeError(f"'{key}' must be a '{value}'")
+        argument_values = (team_name, top_x_position_in_the_table, desired_number_of_scenarios)
+        for (arg_name, expected_type), arg_value in zip(_SIMULATION_ARGUMENT_TYPE_SPEC, argument_values):
+            if not isinstance(arg_value, expected_type):
+                raise TypeError(f"'{arg_name}' must be a '{expected_type}'")
         if desired_number_of_scenarios <= 0:
             raise ValueError("'desired_number_of_scenarios' must be greater than 0")
         if top_x_position_in_the_table <= 0:
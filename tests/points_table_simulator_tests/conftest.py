@@ -0,0 +1,27 @@
+import numpy as np
+import pandas as pd
+import pytest
+from points_table_simulator import PointsTableSimulator
+
+# Explicit schema so the shared frame is built (and type-inferred) exactly once at import time;
+# the team columns are categorical so the suite exercises the simulator's categorical input path
+_MATCH_NUMBERS = np.arange(1, 7, dtype=np.int16)
+_SCHEDULE_DTYPES = {"home": "category", "away": "category", "winner": "category"}
+_BASE_SCHEDULE = pd.DataFrame({
+    "match_number": _MATCH_NUMBERS,
+    "home": ["Team A", "Team B", "Team C", "Team A", "Team B", "Team C"],
+    "away": ["Team B", "Team C", "Team A", "Team C", "Team A", "Team B"],
+    "winner": ["Team A", "Team C", "Team A", "Team C", "Team A", None]
+}).astype(_SCHEDULE_DTYPES)
+
+
+@pytest.fixture(scope="module")
+def base_schedule():
+    """The canonical 6-match schedule shared by the error tests."""
+    return _BASE_SCHEDULE
+
+
+@pytest.fixture(scope="module")
+def base_simulator():
+    """A simulator built once per module from the base schedule, for tests that do not mutate it."""
+    return PointsTableSimulator(_BASE_SCHEDULE, points_for_a_win=3)
@@ -8,6 +8,31 @@ class SuccessTests(TestCase):
 
     test_data_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'data')
 
+    def test_current_points_table_counts_draws_and_no_results_separately_from_losses(self):
+        """
+            This test pins the points table counters for a schedule containing draw and no-result matches:
+            such matches count towards matches_played, matches_drawn and matches_with_no_result, but not
+            towards matches_lost.
+        """
+        tournament_schedule = pd.DataFrame({
+            "match_number": [1, 2, 3, 4, 5, 6],
+            "home": ["Team A", "Team B", "Team C", "Team A", "Team B", "Team C"],
+            "away": ["Team B", "Team C", "Team A", "Team B", "Team C", "Team A"],
+            "winner": ["Team A", "Draw", "No Result", "Team B", "Team C", None]
+        })
+        simulator = PointsTableSimulator(tournament_schedule, points_for_a_win=2)
+
+        current_points_table = simulator.current_points_table
+
+        self.assertEqual(list(current_points_table["team"]), ["Team C", "Team A", "Team B"])
+        self.assertEqual(list(current_points_table["matches_played"]), [3, 3, 4])
+        self.assertEqual(list(current_points_table["matches_won"]), [1, 1, 1])
+        self.assertEqual(list(current_points_table["matches_lost"]), [0, 1, 2])
+        self.assertEqual(list(current_points_table["matches_drawn"]), [1, 0, 1])
+        self.assertEqual(list(current_points_table["matches_with_no_result"]), [1, 1, 0])
+        self.assertEqual(list(current_points_table["remaining_matches"]), [1, 1, 0])
+        self.assertEqual(list(current_points_table["points"]), [4, 3, 3])
+
     def test_simulate_the_qualification_scenarios_function_with_psl_2024_fixture(self):
         schedule_file = os.path.join(self.test_data_folder, 'psl_2024_fixture.csv')
         tournament_schedule = pd.read_csv(schedule_file)